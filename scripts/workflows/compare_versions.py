@@ -5,7 +5,31 @@ Usage: compare_versions.py <new_version> <old_version>
 """
 
 import sys
-from packaging.version import Version
+
+
+def parse_release(version_str):
+    """Parse a plain X.Y.Z release into an int tuple, or None for anything else"""
+    parts = version_str.split(".")
+    if not all(part.isascii() and part.isdigit() for part in parts):
+        return None
+    return tuple(int(part) for part in parts)
+
+
+def is_newer(new_version_str, old_version_str):
+    """Check new > old, skipping the packaging import for plain releases"""
+    new_release = parse_release(new_version_str)
+    old_release = parse_release(old_version_str)
+    
+    if new_release is not None and old_release is not None:
+        # Pad so that 1.0 and 1.0.0 compare equal, as in PEP 440
+        width = max(len(new_release), len(old_release))
+        new_release += (0,) * (width - len(new_release))
+        old_release += (0,) * (width - len(old_release))
+        return new_release > old_release
+    
+    from packaging.version import Version
+    
+    return Version(new_version_str) > Version(old_version_str)
 
 
 def main():
@@ -17,10 +41,7 @@ def main():
     old_version_str = sys.argv[2]
     
     try:
-        new_version = Version(new_version_str)
-        old_version = Version(old_version_str)
-        
-        if new_version > old_version:
+        if is_newer(new_version_str, old_version_str):
             print("true")
         else:
             print("false")
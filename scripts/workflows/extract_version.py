@@ -3,10 +3,23 @@
 Extract version from pyproject.toml
 """
 
+import re
 import sys
-import tomllib
 from pathlib import Path
 
+VERSION_PATTERN = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
+def find_project_version(content):
+    """Find project.version by scanning only the [project] table"""
+    start = content.find("[project]")
+    if start == -1:
+        return None
+    end = content.find("\n[", start)
+    section = content[start:] if end == -1 else content[start:end]
+    match = VERSION_PATTERN.search(section)
+    return match.group(1) if match else None
+
 
 def main():
     pyproject_path = Path("pyproject.toml")
@@ -16,10 +29,15 @@ def main():
         sys.exit(1)
     
     try:
-        with open(pyproject_path, "rb") as f:
-            pyproject_data = tomllib.load(f)
+        content = pyproject_path.read_text(encoding="utf-8")
+        version = find_project_version(content)
+        
+        # Fall back to a full TOML parse for layouts the scan does not cover
+        if version is None:
+            import tomllib
+            
+            version = tomllib.loads(content)["project"]["version"]
         
-        version = pyproject_data["project"]["version"]
         print(version)
         return version
     except Exception as e:
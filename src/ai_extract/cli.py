@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import argparse
 import sys
-from typing import Literal, cast
+from collections.abc import Iterable
+from typing import BinaryIO, Literal, TextIO, cast
 
 import orjson
 
-from .json_core import _extract_json_with_metadata
+from .json_core import _decode, _extract_json_with_metadata
 
 
 def main(args: list[str] | None = None) -> int:
@@ -31,6 +32,7 @@ Examples:
   echo '{"key": "value"}' | ai-extract
   ai-extract -f response.txt --pretty
   ai-extract -f response.txt --all --verbose
+  cat responses.txt | ai-extract --jsonl
         """,
     )
 
@@ -75,6 +77,12 @@ Examples:
         help="Output compact JSON (default)",
     )
 
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Extract from each input line separately, printing one JSON result per line",
+    )
+
     # Metadata options
     parser.add_argument(
         "-v",
@@ -91,6 +99,17 @@ Examples:
 
     parsed_args = parser.parse_args(args)
 
+    if parsed_args.jsonl and parsed_args.pretty:
+        parser.error("--pretty cannot be used with --jsonl")
+
+    # Determine strategy
+    strategy: Literal["first", "all"] = parsed_args.strategy
+    if parsed_args.all:
+        strategy = "all"
+
+    if parsed_args.jsonl:
+        return _run_jsonl(parsed_args, strategy)
+
     # Get input text
     text = _get_input_text(parsed_args)
     if text is None:
@@ -100,11 +119,6 @@ Examples:
         )
         return 1
 
-    # Determine strategy
-    strategy: Literal["first", "all"] = parsed_args.strategy
-    if parsed_args.all:
-        strategy = "all"
-
     # Extract JSON
     result = _extract_json_with_metadata(
         text,
@@ -119,7 +133,8 @@ Examples:
 
     # Output JSON
     output = _format_output(result.data, pretty=parsed_args.pretty)
-    print(output)
+    sys.stdout.flush()
+    _write_output(output)
 
     # Show metadata if verbose
     if parsed_args.verbose:
@@ -128,34 +143,145 @@ Examples:
     return 0
 
 
-def _get_input_text(args: argparse.Namespace) -> str | None:
-    """Get input text from arguments, file, or stdin."""
+def _run_jsonl(args: argparse.Namespace, strategy: Literal["first", "all"]) -> int:
+    """Run --jsonl mode over the argument, file, or stdin input."""
+    # Split on "\n" only, like file and stdin iteration: str.splitlines() also
+    # breaks on U+2028/U+2029 and other separators orjson leaves unescaped.
+    if args.text:
+        return _extract_lines(cast(str, args.text).split("\n"), strategy, args.verbose)
+
+    # Files and piped stdin are read as bytes so one invalid UTF-8 byte only
+    # affects its own line instead of aborting the run with a decode error.
+    if args.file:
+        file = _open_input_file(args.file)
+        if file is None:
+            return 1
+        with file:
+            return _extract_lines(file, strategy, args.verbose)
+
+    stream = _piped_stdin()
+    if stream is not None:
+        return _extract_lines(stream, strategy, args.verbose)
+
+    print(
+        "Error: No input provided. Use text argument, -f file, or pipe input.",
+        file=sys.stderr,
+    )
+    return 1
+
+
+def _extract_lines(
+    lines: Iterable[str | bytes],
+    strategy: Literal["first", "all"],
+    verbose: bool,
+) -> int:
+    """Extract JSON from each non-blank line, printing one compact result per line.
+
+    Lines without JSON are reported on stderr and make the exit code 1, but
+    do not stop processing of the remaining lines.
+    """
+    exit_code = 0
+    processed = 0
+    extracted = 0
+
+    # Flush once up front rather than per line, so results stay batched.
+    sys.stdout.flush()
+    for line_number, line in enumerate(lines, start=1):
+        if not line or line.isspace():
+            continue
+        # bytes.isspace() only knows ASCII; recheck blanks such as U+00A0.
+        if isinstance(line, bytes) and not line.isascii() and _decode(line).isspace():
+            continue
+
+        processed += 1
+        result = _extract_json_with_metadata(line, strategy=strategy)
+        if not result.success:
+            error_msg = result.error.message if result.error else "Unknown error"
+            print(f"Error: line {line_number}: {error_msg}", file=sys.stderr)
+            exit_code = 1
+            continue
+
+        extracted += 1
+        _write_output(_format_output(result.data))
+
+    if verbose:
+        print("\n--- Metadata ---", file=sys.stderr)
+        print(f"Lines with JSON: {extracted}/{processed}", file=sys.stderr)
+
+    return exit_code
+
+
+def _get_input_text(args: argparse.Namespace) -> str | bytes | None:
+    """Get input text from arguments, file, or stdin.
+
+    Files and piped stdin are read as raw bytes: clean JSON then goes to
+    orjson without a decode, and the extractor decodes only if it has to scan.
+    Text-only replacement streams without a ``buffer`` are read as str.
+    """
     if args.text:
         return cast(str, args.text)
 
     if args.file:
-        try:
-            with open(args.file, encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError:
-            print(f"Error: File not found: {args.file}", file=sys.stderr)
-            return None
-        except PermissionError:
-            print(f"Error: Permission denied: {args.file}", file=sys.stderr)
+        file = _open_input_file(args.file)
+        if file is None:
             return None
+        with file:
+            return file.read()
 
     # Try stdin
-    if not sys.stdin.isatty():
-        return sys.stdin.read()
+    stream = _piped_stdin()
+    if stream is not None:
+        return stream.read()
 
     return None
 
 
-def _format_output(data: object, pretty: bool = False) -> str:
-    """Format data as JSON string."""
+def _open_input_file(path: str) -> BinaryIO | None:
+    """Open an input file for binary reading, reporting failures on stderr."""
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        print(f"Error: File not found: {path}", file=sys.stderr)
+        return None
+    except PermissionError:
+        print(f"Error: Permission denied: {path}", file=sys.stderr)
+        return None
+
+
+def _piped_stdin() -> BinaryIO | TextIO | None:
+    """Return stdin when input is piped, or None for an interactive terminal.
+
+    The binary layer is preferred; text-only replacement streams without a
+    ``buffer`` (e.g. io.StringIO) are returned as-is.
+    """
+    if sys.stdin.isatty():
+        return None
+    return cast(BinaryIO | TextIO, getattr(sys.stdin, "buffer", sys.stdin))
+
+
+def _format_output(data: object, pretty: bool = False) -> bytes:
+    """Format data as UTF-8 encoded JSON."""
     if pretty:
-        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
-    return orjson.dumps(data).decode("utf-8")
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return orjson.dumps(data)
+
+
+def _write_output(output: bytes) -> None:
+    """Write encoded JSON plus a newline to stdout.
+
+    orjson already produces UTF-8 bytes, so they go straight to the binary
+    layer instead of being decoded for print() to encode again. Callers
+    flush the text layer once before their first write so earlier prints
+    stay in order. Text-only replacement streams without a ``buffer``
+    (e.g. io.StringIO) get the decoded form.
+    """
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is None:
+        sys.stdout.write(output.decode("utf-8") + "\n")
+        return
+
+    stream.write(output)
+    stream.write(b"\n")
 
 
 def _print_metadata(result: object) -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterator
 from typing import Any, Literal
 
 import orjson
@@ -12,11 +14,26 @@ from .types import Candidate, ErrorType, ExtractError, ExtractionMethod, Extract
 # SECTION 1: Shared helpers
 # ============================================================================
 
+# Scanner tokens: a single bracket, or a whole string literal (escapes
+# included; an unterminated one runs to the end of input). Consuming strings
+# inside the regex engine leaves no in-string or escape state for Python to
+# track. The pattern leads with one character class so the engine can still
+# skip plain text with its fast prefix search.
+_STRUCTURAL_TOKENS = re.compile(r'[{}\[\]"](?:(?<=")[^"\\]*(?:\\.[^"\\]*)*(?:"|\\?\Z))?', re.DOTALL)
+
+# Bound once: candidate parsing calls these in loops.
+_loads = orjson.loads
+_JSONDecodeError = orjson.JSONDecodeError
+
+# Enum member lookup goes through the metaclass (~15x a global read);
+# _build_candidates tags every region with this one.
+_BRACE_MATCH = ExtractionMethod.BRACE_MATCH
+
 
 def _try_direct_parse_candidate(text: str) -> Candidate | None:
     """Try parsing the full input as JSON and return a direct candidate."""
     try:
-        parsed_data: Any = orjson.loads(text)
+        parsed_data: Any = _loads(text)
         return Candidate(
             raw=text,
             method=ExtractionMethod.DIRECT_PARSE,
@@ -24,10 +41,104 @@ def _try_direct_parse_candidate(text: str) -> Candidate | None:
             end_pos=len(text),
             parsed_data=parsed_data,
         )
-    except orjson.JSONDecodeError:
+    except _JSONDecodeError:
         return None
 
 
+def _has_no_opener(text: str) -> bool:
+    """Return True when text cannot contain an object or array.
+
+    Substring checks run in C, so plain prose is rejected without entering
+    the Python-level scanners.
+    """
+    return "{" not in text and "[" not in text
+
+
+# Depth reported by _iter_regions when a closer does not match its opener.
+_MISMATCH: int = -1
+
+
+def _iter_regions(text: str) -> Iterator[tuple[int, int, int]]:
+    """Yield ``(start_pos, end_pos, depth)`` for each bracketed region as it closes.
+
+    This is the one structural scan shared by both strategies. It is O(n) and
+    only visits brackets outside strings: the regex engine jumps over plain
+    text and string literals, leaving just the opener stack to track here.
+
+    `depth` counts the regions still open around the closed one. A mismatched
+    closer empties the stack and is reported with depth ``_MISMATCH``.
+    """
+    if _has_no_opener(text):
+        return
+
+    # Opener positions only: the opener itself is text[start], so pushes
+    # need no (char, pos) tuple.
+    stack: list[int] = []
+
+    for match in _STRUCTURAL_TOKENS.finditer(text):
+        i: int = match.start()
+        char: str = text[i]
+        if char == '"':
+            continue
+
+        if char in "{[":
+            stack.append(i)
+            continue
+
+        if not stack:
+            continue
+
+        start: int = stack.pop()
+        opener: str = text[start]
+        if (char == "}" and opener != "{") or (char == "]" and opener != "["):
+            stack.clear()
+            yield start, i + 1, _MISMATCH
+            continue
+
+        yield start, i + 1, len(stack)
+
+
+def _adopt_nested(candidates: list[Candidate], start: int, end_pos: int) -> list[Candidate]:
+    """Pop the tail candidates enclosed by ``[start, end_pos)`` and return them.
+
+    Regions close innermost-first, so everything nested inside a newly closed
+    span sits at the end of `candidates`. The popped children come back in
+    reverse scan order.
+    """
+    nested_children: list[Candidate] = []
+    while candidates:
+        tail_candidate: Candidate = candidates[-1]
+        if tail_candidate.start_pos >= start and tail_candidate.end_pos <= end_pos:
+            nested_children.append(candidates.pop())
+            continue
+        break
+    return nested_children
+
+
+def _build_candidates(text: str, spans: list[tuple[int, int]]) -> list[Candidate]:
+    """Build maximal candidate trees from ``(start_pos, end_pos)`` spans in close order.
+
+    Uses: _adopt_nested
+    """
+    candidates: list[Candidate] = []
+
+    for start, end_pos in spans:
+        # TODO: Extra computation for raw string??
+        raw: str = text[start:end_pos]
+
+        # Keep only maximal candidates for a region:
+        # when a larger enclosing span closes, drop its nested subsets.
+        nested_children: list[Candidate] = _adopt_nested(candidates, start, end_pos)
+
+        # Positional arguments: this runs once per region, and keyword binding
+        # roughly doubles dataclass construction cost. The adopted list is
+        # passed in so no default children list is allocated and discarded.
+        current_candidate = Candidate(raw, _BRACE_MATCH, start, end_pos, None, nested_children)
+        candidates.append(current_candidate)
+
+    return candidates
+
+
 # ============================================================================
 # SECTION 2: First strategy helpers
 # ============================================================================
@@ -39,9 +150,9 @@ def _parse_subtree_first(candidate: Candidate) -> Any | None:
         return candidate.parsed_data
 
     try:
-        candidate.parsed_data = orjson.loads(candidate.raw)
+        candidate.parsed_data = _loads(candidate.raw)
         return candidate.parsed_data
-    except orjson.JSONDecodeError:
+    except _JSONDecodeError:
         pass
 
     for child in reversed(candidate.children):
@@ -52,76 +163,50 @@ def _parse_subtree_first(candidate: Candidate) -> Any | None:
     return None
 
 
-def _extract_first_streaming(text: str) -> ExtractResult:
-    """Stream-first extraction: parse each completed top-level region immediately."""
-    region_candidates: list[Candidate] = []
-    stack: list[tuple[str, int]] = []
-    in_string: bool = False
-    escape_next: bool = False
-
-    for i, char in enumerate(text):
-        if escape_next:
-            escape_next = False
-            continue
+def _parse_first_of(candidates: list[Candidate]) -> Any | None:
+    """Return the first value parsed from candidate subtrees, in scan order."""
+    for candidate in candidates:
+        parsed = _parse_subtree_first(candidate)
+        if parsed is not None:
+            return parsed
+    return None
 
-        if in_string and char == "\\":
-            escape_next = True
-            continue
 
-        if char == '"':
-            in_string = not in_string
-            continue
+def _extract_first_streaming(text: str) -> ExtractResult:
+    """Stream-first extraction: parse each completed top-level region immediately.
 
-        if in_string:
-            continue
+    Regions nested inside a still-open one are only recorded as spans; they
+    become candidates only if their top-level region fails to parse, so the
+    common valid case never slices or allocates them.
 
-        if char in "{[":
-            stack.append((char, i))
-            continue
+    Uses: _iter_regions, _build_candidates, _parse_first_of
+    """
+    nested_spans: list[tuple[int, int]] = []
 
-        if char not in "}]":
+    for start, end_pos, depth in _iter_regions(text):
+        if depth == _MISMATCH:
+            nested_spans.clear()
             continue
 
-        if not stack:
+        if depth:
+            nested_spans.append((start, end_pos))
             continue
 
-        opener, start = stack.pop()
-        if (char == "}" and opener != "{") or (char == "]" and opener != "["):
-            stack.clear()
-            region_candidates.clear()
-            continue
-
-        end_pos: int = i + 1
-        current_candidate = Candidate(
-            raw=text[start:end_pos],
-            method=ExtractionMethod.BRACE_MATCH,
-            start_pos=start,
-            end_pos=end_pos,
-            parsed_data=None,
-        )
+        try:
+            return ExtractResult(success=True, data=_loads(text[start:end_pos]))
+        except _JSONDecodeError:
+            pass
 
-        nested_children: list[Candidate] = []
-        while region_candidates:
-            tail_candidate: Candidate = region_candidates[-1]
-            if tail_candidate.start_pos >= start and tail_candidate.end_pos <= end_pos:
-                nested_children.append(region_candidates.pop())
-                continue
-            break
-        current_candidate.children = nested_children
-
-        if stack:
-            region_candidates.append(current_candidate)
-        else:
-            parsed = _parse_subtree_first(current_candidate)
-            if parsed is not None:
-                return ExtractResult(success=True, data=parsed)
+        parsed = _parse_first_of(_build_candidates(text, nested_spans))
+        if parsed is not None:
+            return ExtractResult(success=True, data=parsed)
+        nested_spans.clear()
 
     # End-of-input fallback: try any remaining candidates from unfinished regions,
     # in scan order.
-    for candidate in region_candidates:
-        parsed = _parse_subtree_first(candidate)
-        if parsed is not None:
-            return ExtractResult(success=True, data=parsed)
+    parsed = _parse_first_of(_build_candidates(text, nested_spans))
+    if parsed is not None:
+        return ExtractResult(success=True, data=parsed)
 
     return ExtractResult(
         success=False,
@@ -135,71 +220,13 @@ def _extract_first_streaming(text: str) -> ExtractResult:
 def _find_by_braces(text: str) -> list[Candidate]:
     """Find balanced {...} and [...] structures in a single pass.
 
-    This scanner is O(n): each character is visited once while tracking
-    nesting depth and string/escape state.
+    Uses: _iter_regions, _build_candidates
     """
-    candidates: list[Candidate] = []
-    stack: list[tuple[str, int]] = []
-    in_string: bool = False
-    escape_next: bool = False
-
-    for i, char in enumerate(text):
-        if escape_next:
-            escape_next = False
-            continue
-
-        if in_string and char == "\\":
-            escape_next = True
-            continue
-
-        if char == '"':
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char in "{[":
-            stack.append((char, i))
-            continue
-
-        if char not in "}]":
-            continue
-
-        if not stack:
-            continue
-
-        opener, start = stack.pop()
-        if (char == "}" and opener != "{") or (char == "]" and opener != "["):
-            stack.clear()
-            continue
-        end: int = i
-
-        # TODO: Extra computation for raw string??
-        raw: str = text[start : end + 1]
-        end_pos: int = end + 1
-        current_candidate = Candidate(
-            raw=raw,
-            method=ExtractionMethod.BRACE_MATCH,
-            start_pos=start,
-            end_pos=end_pos,
-            parsed_data=None,
-        )
-
-        # Keep only maximal candidates for a region:
-        # when a larger enclosing span closes, drop its nested subsets.
-        nested_children: list[Candidate] = []
-        while candidates:
-            tail_candidate: Candidate = candidates[-1]
-            if tail_candidate.start_pos >= start and tail_candidate.end_pos <= end_pos:
-                nested_children.append(candidates.pop())
-                continue
-            break
-
-        current_candidate.children = nested_children
-        candidates.append(current_candidate)
-
-    return candidates
+    # A mismatch only resets nesting; keep the spans found so far.
+    spans: list[tuple[int, int]] = [
+        (start, end_pos) for start, end_pos, depth in _iter_regions(text) if depth != _MISMATCH
+    ]
+    return _build_candidates(text, spans)
 
 
 def _find_candidates(text: str) -> list[Candidate]:
@@ -229,11 +256,11 @@ def _collect_subtree_all(candidate: Candidate, results: list[Any]) -> None:
         return
 
     try:
-        data: Any = orjson.loads(candidate.raw)
+        data: Any = _loads(candidate.raw)
         candidate.parsed_data = data
         results.append(data)
         return
-    except orjson.JSONDecodeError:
+    except _JSONDecodeError:
         pass
 
     for child in reversed(candidate.children):
@@ -268,10 +295,26 @@ def _parse_all(candidates: list[Candidate]) -> ExtractResult:
 # ============================================================================
 # SECTION 4: Internal orchestration
 # ============================================================================
+def _decode(text: str | bytes) -> str:
+    """Return text as str for scanning; invalid UTF-8 becomes U+FFFD."""
+    if isinstance(text, bytes):
+        return text.decode("utf-8", errors="replace")
+    return text
+
+
+def _empty_input_result() -> ExtractResult:
+    """Return the failure result for empty or whitespace-only input."""
+    return ExtractResult(
+        success=False,
+        error=ExtractError(
+            "Empty input text",
+            ErrorType.NO_JSON_FOUND,
+        ),
+    )
 
 
 def _extract_json_with_metadata(
-    text: str,
+    text: str | bytes,
     *,
     strategy: Literal["first", "all"] = "first",
 ) -> ExtractResult:
@@ -280,7 +323,9 @@ def _extract_json_with_metadata(
     Uses: _find_candidates, _extract_first_streaming, _parse_all
 
     Args:
-        text: The text containing JSON to extract.
+        text: The text containing JSON to extract. With strategy="first",
+            UTF-8 bytes are parsed directly and only decoded if the input is
+            not clean JSON; strategy="all" always decodes them first.
         strategy: How to handle multiple JSON blocks.
 
     Returns:
@@ -291,23 +336,26 @@ def _extract_json_with_metadata(
         >>> result.success
         True
     """
-    if not text or not text.strip():
-        return ExtractResult(
-            success=False,
-            error=ExtractError(
-                "Empty input text",
-                ErrorType.NO_JSON_FOUND,
-            ),
-        )
+    if not text or text.isspace():
+        return _empty_input_result()
 
     if strategy == "first":
-        direct_candidate = _try_direct_parse_candidate(text)
-        if direct_candidate is not None:
-            return ExtractResult(success=True, data=direct_candidate.parsed_data)
-        return _extract_first_streaming(text)
+        # Clean JSON is the common case: parse it without building a candidate.
+        try:
+            data: Any = _loads(text)
+        except _JSONDecodeError:
+            decoded: str = _decode(text)
+            # bytes.isspace() only knows ASCII; recheck blanks such as U+00A0.
+            if decoded.isspace():
+                return _empty_input_result()
+            return _extract_first_streaming(decoded)
+        return ExtractResult(success=True, data=data)
 
     if strategy == "all":
-        candidates: list[Candidate] = _find_candidates(text)
+        decoded = _decode(text)
+        if decoded.isspace():
+            return _empty_input_result()
+        candidates: list[Candidate] = _find_candidates(decoded)
         if not candidates:
             return ExtractResult(
                 success=False,
@@ -325,7 +373,7 @@ def _extract_json_with_metadata(
 # SECTION 5: Public API
 # ============================================================================
 def extract_json(
-    text: str,
+    text: str | bytes,
     *,
     strategy: Literal["first", "all"] = "first",
     raise_on_error: bool = True,
@@ -335,7 +383,8 @@ def extract_json(
     Uses: _extract_json_with_metadata
 
     Args:
-        text: The text containing JSON to extract.
+        text: The text containing JSON to extract. UTF-8 bytes (HTTP
+            bodies, file or subprocess output) are accepted as-is.
         strategy: How to handle multiple JSON blocks:
             - "first": Return the first valid JSON found (default).
             - "all": Return a list of all valid JSON blocks.
@@ -1,11 +1,19 @@
 """Tests for ai_extract.cli module."""
 
 import tempfile
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 from unittest.mock import patch
 
-from ai_extract.cli import _format_output, _get_input_text, _print_metadata, main
+import pytest
+
+from ai_extract.cli import (
+    _format_output,
+    _get_input_text,
+    _print_metadata,
+    _write_output,
+    main,
+)
 from ai_extract.types import ExtractResult
 
 
@@ -117,6 +125,138 @@ class TestMain:
         assert exit_code == 1
 
 
+class TestJsonlMode:
+    """Tests for --jsonl line-by-line mode."""
+
+    def test_jsonl_from_stdin(self) -> None:
+        """Test one compact result per input line, skipping blank lines."""
+        with (
+            patch("sys.stdin", StringIO('{"a": 1}\n\nresult: [1, 2]\n')),
+            patch("sys.stdin.isatty", return_value=False),
+            patch("sys.stdout", new_callable=StringIO) as mock_stdout,
+        ):
+            exit_code = main(["--jsonl"])
+        assert exit_code == 0
+        assert mock_stdout.getvalue() == '{"a":1}\n[1,2]\n'
+
+    def test_jsonl_skips_unicode_blank_lines_from_bytes(self) -> None:
+        """Test that non-ASCII blank lines read as bytes are skipped like text."""
+        stdin = TextIOWrapper(BytesIO(b'{"a": 1}\n\xc2\xa0\n\xe3\x80\x80 \n[2]\n'))
+        with (
+            patch("sys.stdin", stdin),
+            patch("sys.stdin.isatty", return_value=False),
+            patch("sys.stdout", new_callable=StringIO) as mock_stdout,
+            patch("sys.stderr", new_callable=StringIO) as mock_stderr,
+        ):
+            exit_code = main(["--jsonl", "--verbose"])
+        assert exit_code == 0
+        assert mock_stdout.getvalue() == '{"a":1}\n[2]\n'
+        assert "Lines with JSON: 2/2" in mock_stderr.getvalue()
+
+    def test_jsonl_from_file(self) -> None:
+        """Test reading lines from a file."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+            f.write('{"a": 1} {"b": 2}\n{"c": 3}\n')
+            filepath = f.name
+
+        try:
+            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                exit_code = main(["--jsonl", "--all", "-f", filepath])
+            assert exit_code == 0
+            assert mock_stdout.getvalue() == '[{"a":1},{"b":2}]\n[{"c":3}]\n'
+        finally:
+            Path(filepath).unlink()
+
+    def test_jsonl_invalid_utf8_only_affects_its_line(self) -> None:
+        """Test that a bad byte on one line does not abort the other lines."""
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".txt", delete=False) as f:
+            f.write(b'{"a": 1}\n\xff{"b": 2}\n{"c": 3}\n')
+            filepath = f.name
+
+        try:
+            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                exit_code = main(["--jsonl", "-f", filepath])
+            assert exit_code == 0
+            assert mock_stdout.getvalue() == '{"a":1}\n{"b":2}\n{"c":3}\n'
+        finally:
+            Path(filepath).unlink()
+
+    def test_jsonl_stdin_buffer_read_as_bytes(self) -> None:
+        """Test that piped stdin with a binary layer tolerates invalid UTF-8."""
+        stdin = TextIOWrapper(BytesIO(b'\xff{"a": 1}\n{"b": 2}\n'), encoding="utf-8")
+        with (
+            patch("sys.stdin", stdin),
+            patch("sys.stdin.isatty", return_value=False),
+            patch("sys.stdout", new_callable=StringIO) as mock_stdout,
+        ):
+            exit_code = main(["--jsonl"])
+        assert exit_code == 0
+        assert mock_stdout.getvalue() == '{"a":1}\n{"b":2}\n'
+
+    def test_jsonl_from_argument(self) -> None:
+        """Test splitting a text argument into lines."""
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            exit_code = main(["--jsonl", '{"a": 1}\n{"b": 2}'])
+        assert exit_code == 0
+        assert mock_stdout.getvalue() == '{"a":1}\n{"b":2}\n'
+
+    def test_jsonl_argument_splits_only_on_newlines(self) -> None:
+        """Test that U+2028 inside a JSON string does not split the record."""
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            exit_code = main(["--jsonl", '{"a": "x\u2028y"}\r\n{"b": 1}'])
+        assert exit_code == 0
+        assert mock_stdout.getvalue() == '{"a":"x\u2028y"}\n{"b":1}\n'
+
+    def test_jsonl_reports_failed_lines_and_continues(self) -> None:
+        """Test that a line without JSON is reported but later lines still print."""
+        with (
+            patch("sys.stdout", new_callable=StringIO) as mock_stdout,
+            patch("sys.stderr", new_callable=StringIO) as mock_stderr,
+        ):
+            exit_code = main(["--jsonl", "--verbose", 'no json\n{"b": 2}'])
+        assert exit_code == 1
+        assert mock_stdout.getvalue() == '{"b":2}\n'
+        assert "Error: line 1:" in mock_stderr.getvalue()
+        assert "Lines with JSON: 1/2" in mock_stderr.getvalue()
+
+    def test_jsonl_file_not_found(self) -> None:
+        """Test error when the --jsonl input file is missing."""
+        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
+            exit_code = main(["--jsonl", "-f", "/nonexistent/file.txt"])
+        assert exit_code == 1
+        assert "File not found" in mock_stderr.getvalue()
+
+    def test_jsonl_file_permission_error(self) -> None:
+        """Test error when the --jsonl input file is unreadable."""
+        with (
+            patch("builtins.open", side_effect=PermissionError("Permission denied")),
+            patch("sys.stderr", new_callable=StringIO) as mock_stderr,
+        ):
+            exit_code = main(["--jsonl", "-f", "test.txt"])
+        assert exit_code == 1
+        assert "Permission denied" in mock_stderr.getvalue()
+
+    def test_jsonl_no_input_error(self) -> None:
+        """Test error when no input is available."""
+        with (
+            patch("sys.stdin.isatty", return_value=True),
+            patch("sys.stderr", new_callable=StringIO) as mock_stderr,
+        ):
+            exit_code = main(["--jsonl"])
+        assert exit_code == 1
+        assert "No input provided" in mock_stderr.getvalue()
+
+    def test_jsonl_rejects_pretty(self) -> None:
+        """Test that --pretty is rejected because it would break line framing."""
+        with (
+            patch("sys.stderr", new_callable=StringIO) as mock_stderr,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main(["--jsonl", "--pretty", "{}"])
+        assert exc_info.value.code == 2
+        assert "--pretty cannot be used with --jsonl" in mock_stderr.getvalue()
+
+
 class TestFormatOutput:
     """Tests for _format_output function."""
 
@@ -124,20 +264,60 @@ class TestFormatOutput:
         """Test compact JSON format."""
         data = {"key": "value", "num": 42}
         result = _format_output(data, pretty=False)
-        assert result == '{"key":"value","num":42}'
+        assert result == b'{"key":"value","num":42}'
 
     def test_pretty_format(self) -> None:
         """Test pretty JSON format."""
         data = {"key": "value"}
         result = _format_output(data, pretty=True)
-        assert "\n" in result
-        assert "  " in result  # Indentation
+        assert b"\n" in result
+        assert b"  " in result  # Indentation
 
     def test_array_format(self) -> None:
         """Test array formatting."""
         data = [1, 2, 3]
         result = _format_output(data, pretty=False)
-        assert result == "[1,2,3]"
+        assert result == b"[1,2,3]"
+
+
+class TestWriteOutput:
+    """Tests for _write_output function."""
+
+    def test_writes_bytes_to_binary_layer(self) -> None:
+        """Test that encoded output bypasses the text layer."""
+        buffer = BytesIO()
+        stdout = TextIOWrapper(buffer, encoding="utf-8")
+        with patch("sys.stdout", stdout):
+            _write_output('{"k":"\u00e9"}'.encode())
+        assert buffer.getvalue() == '{"k":"\u00e9"}\n'.encode()
+
+    def test_main_flushes_pending_text_before_bytes(self) -> None:
+        """Test that text already written to stdout comes out before the JSON."""
+        buffer = BytesIO()
+        stdout = TextIOWrapper(buffer, encoding="utf-8")
+        stdout.write("header\n")
+        with patch("sys.stdout", stdout):
+            main(["[1]"])
+        assert buffer.getvalue() == b"header\n[1]\n"
+
+    def test_jsonl_flushes_pending_text_once(self) -> None:
+        """Test that --jsonl flushes pending text before the first line only."""
+        buffer = BytesIO()
+        stdout = TextIOWrapper(buffer, encoding="utf-8")
+        stdout.write("header\n")
+        with (
+            patch("sys.stdout", stdout),
+            patch.object(stdout, "flush", wraps=stdout.flush) as mock_flush,
+        ):
+            main(["--jsonl", "[1]\n[2]\n[3]"])
+        assert buffer.getvalue() == b"header\n[1]\n[2]\n[3]\n"
+        mock_flush.assert_called_once_with()
+
+    def test_falls_back_to_text_stream(self) -> None:
+        """Test streams without a buffer attribute receive decoded text."""
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            _write_output(b"[1]")
+        assert mock_stdout.getvalue() == "[1]\n"
 
 
 class TestGetInputText:
@@ -163,7 +343,7 @@ class TestGetInputText:
         try:
             args = argparse.Namespace(text=None, file=filepath)
             result = _get_input_text(args)
-            assert result == "file content"
+            assert result == b"file content"
         finally:
             Path(filepath).unlink()
 
@@ -179,6 +359,19 @@ class TestGetInputText:
             result = _get_input_text(args)
         assert result == "stdin content"
 
+    def test_stdin_buffer_read_as_bytes(self) -> None:
+        """Test that piped stdin with a binary layer is read as bytes."""
+        import argparse
+
+        args = argparse.Namespace(text=None, file=None)
+        stdin = TextIOWrapper(BytesIO('{"k": "é"}'.encode()), encoding="utf-8")
+        with (
+            patch("sys.stdin", stdin),
+            patch("sys.stdin.isatty", return_value=False),
+        ):
+            result = _get_input_text(args)
+        assert result == '{"k": "é"}'.encode()
+
     def test_no_input(self) -> None:
         """Test when no input is available."""
         import argparse
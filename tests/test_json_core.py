@@ -1,14 +1,21 @@
 """Tests for ai_extract.json_core internals."""
 
+from typing import Literal
+
 import pytest
 
 from ai_extract import ErrorType, ExtractError
 from ai_extract.json_core import (
+    _MISMATCH,
+    _adopt_nested,
+    _build_candidates,
     _collect_subtree_all,
     _extract_first_streaming,
     _extract_json_with_metadata,
     _find_by_braces,
     _find_candidates,
+    _has_no_opener,
+    _iter_regions,
     _parse_all,
     _parse_subtree_first,
     _try_direct_parse_candidate,
@@ -28,6 +35,45 @@ class TestTryDirectParseCandidate:
         assert _try_direct_parse_candidate("not json") is None
 
 
+class TestHasNoOpener:
+    def test_plain_text_has_no_opener(self) -> None:
+        assert _has_no_opener('just "quoted" prose') is True
+
+    def test_object_or_array_opener_detected(self) -> None:
+        assert _has_no_opener("a { b") is False
+        assert _has_no_opener("a [ b") is False
+
+
+class TestIterRegions:
+    def test_yields_regions_innermost_first_with_depth(self) -> None:
+        text = '{"a": [1]} []'
+        assert list(_iter_regions(text)) == [(6, 9, 1), (0, 10, 0), (11, 13, 0)]
+
+    def test_reports_mismatch_and_resets_nesting(self) -> None:
+        assert list(_iter_regions("[{]}")) == [(1, 3, _MISMATCH)]
+
+    def test_no_opener_yields_nothing(self) -> None:
+        assert list(_iter_regions('plain "text" ]')) == []
+
+
+class TestAdoptNested:
+    def test_pops_enclosed_tail_candidates(self) -> None:
+        outside = Candidate("[]", ExtractionMethod.BRACE_MATCH, 0, 2)
+        inside = Candidate("{}", ExtractionMethod.BRACE_MATCH, 5, 7)
+        candidates = [outside, inside]
+        assert _adopt_nested(candidates, 4, 9) == [inside]
+        assert candidates == [outside]
+
+
+class TestBuildCandidates:
+    def test_builds_maximal_trees_in_scan_order(self) -> None:
+        text = '[{"a": 1}] {}'
+        candidates = _build_candidates(text, [(1, 9), (0, 10), (11, 13)])
+        assert [c.raw for c in candidates] == ['[{"a": 1}]', "{}"]
+        assert [c.raw for c in candidates[0].children] == ['{"a": 1}']
+        assert candidates[0].method == ExtractionMethod.BRACE_MATCH
+
+
 class TestParseSubtreeFirst:
     def test_returns_cached_data(self) -> None:
         candidate = Candidate("{}", ExtractionMethod.BRACE_MATCH, 0, 2, parsed_data={"x": 1})
@@ -74,6 +120,13 @@ class TestExtractFirstStreaming:
         assert result.success is True
         assert result.data == {"k": 'a\\"b'}
 
+    def test_ignores_brackets_inside_strings(self) -> None:
+        result = _extract_first_streaming('note {"k": "a } [ b"}')
+        assert result.data == {"k": "a } [ b"}
+
+    def test_backslash_outside_string_is_ignored(self) -> None:
+        assert _extract_first_streaming('C:\\dir\\ {"a": 1}').data == {"a": 1}
+
     def test_ignores_stray_closer_and_mismatch(self) -> None:
         assert _extract_first_streaming('} {"a": 1}').data == {"a": 1}
         bad = _extract_first_streaming("{]")
@@ -94,6 +147,16 @@ class TestExtractFirstStreaming:
         assert result.success is True
         assert result.data == [{"a": 1}, {"b": 2}]
 
+    def test_invalid_top_level_falls_back_to_nested_region(self) -> None:
+        result = _extract_first_streaming('{oops [{"a": 1}, {"b": 2}]} {"c": 3}')
+        assert result.success is True
+        assert result.data == [{"a": 1}, {"b": 2}]
+
+    def test_invalid_top_level_without_valid_nested_moves_on(self) -> None:
+        result = _extract_first_streaming('{oops {bad}} {"c": 3}')
+        assert result.success is True
+        assert result.data == {"c": 3}
+
 
 class TestFindByBraces:
     def test_simple_object(self) -> None:
@@ -121,6 +184,10 @@ class TestFindByBraces:
         assert len(candidates) == 1
         assert candidates[0].raw == text
 
+    def test_backslash_outside_string_is_ignored(self) -> None:
+        candidates = _find_by_braces('path\\ {"a": 1}')
+        assert [c.raw for c in candidates] == ['{"a": 1}']
+
     def test_unbalanced_and_mismatched(self) -> None:
         assert _find_by_braces("{") == []
         assert _find_by_braces("{]") == []
@@ -204,6 +271,12 @@ class TestExtractJsonWithMetadataInternal:
         assert result.error is not None
         assert result.error.error_type == ErrorType.NO_JSON_FOUND
 
+    def test_whitespace_only_input(self) -> None:
+        result = _extract_json_with_metadata(" \n\t ")
+        assert result.success is False
+        assert result.error is not None
+        assert result.error.message == "Empty input text"
+
     def test_invalid_strategy_raises(self) -> None:
         with pytest.raises(ValueError):
             _extract_json_with_metadata("{}", strategy="bad")  # type: ignore[arg-type]
@@ -214,6 +287,33 @@ class TestExtractJsonWithMetadataInternal:
         assert result.error is not None
         assert result.error.error_type == ErrorType.NO_JSON_FOUND
 
+    def test_bytes_input(self) -> None:
+        assert _extract_json_with_metadata(b'{"a": 1}').data == {"a": 1}
+        assert _extract_json_with_metadata(b'Sure: {"a": 1} ok').data == {"a": 1}
+
+        result = _extract_json_with_metadata(b'{"a": 1} and {"b": 2}', strategy="all")
+        assert result.data == [{"a": 1}, {"b": 2}]
+
+    def test_bytes_with_invalid_utf8_outside_json(self) -> None:
+        result = _extract_json_with_metadata(b'\xff\xfe {"a": "\xc3\xa9"}')
+        assert result.success is True
+        assert result.data == {"a": "\u00e9"}
+
+    def test_empty_bytes_input(self) -> None:
+        result = _extract_json_with_metadata(b" \n")
+        assert result.success is False
+        assert result.error is not None
+        assert result.error.message == "Empty input text"
+
+    @pytest.mark.parametrize("strategy", ["first", "all"])
+    def test_unicode_blank_bytes_match_str(self, strategy: Literal["first", "all"]) -> None:
+        for blank in ("\u00a0", "\u3000 \n"):
+            str_result = _extract_json_with_metadata(blank, strategy=strategy)
+            bytes_result = _extract_json_with_metadata(blank.encode(), strategy=strategy)
+            assert str_result.error is not None
+            assert bytes_result.error is not None
+            assert bytes_result.error.message == str_result.error.message == "Empty input text"
+
 
 class TestExtractJsonPublic:
     def test_success(self) -> None:
@@ -228,3 +328,6 @@ class TestExtractJsonPublic:
     def test_raise_on_error_true_raises(self) -> None:
         with pytest.raises(ExtractError):
             extract_json("no json", raise_on_error=True)
+
+    def test_bytes_input(self) -> None:
+        assert extract_json(b"Result: [1, 2]") == [1, 2]